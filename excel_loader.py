@@ -0,0 +1,156 @@
+import re
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+# Number of rows buffered per column before converting to a typed array
+CHUNK_SIZE = 10000
+
+# Strings pd.read_excel treats as missing by default
+NA_VALUES = {
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+}
+
+
+def _cell_value(cell):
+    """Map empty cells, error cells and pandas' default NA strings to NaN so both ingestion modes agree."""
+    value = cell.value
+    if value is None or cell.data_type == "e" or (isinstance(value, str) and value in NA_VALUES):
+        return np.nan
+    return value
+
+
+def _open_sheet(file, sheet_name):
+    """Open a workbook in read-only mode and return it with the requested sheet."""
+    if hasattr(file, "seek"):
+        file.seek(0)
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    if isinstance(sheet_name, int):
+        sheet = workbook.worksheets[sheet_name]
+    else:
+        sheet = workbook[sheet_name]
+    # Read-only sheets trust the stored <dimension> tag, which some writers get wrong
+    sheet.reset_dimensions()
+    return workbook, sheet
+
+
+def _is_empty(value):
+    return value is None or value == ""
+
+
+def _row_width(row):
+    """Number of cells up to and including the last non-empty one."""
+    width = len(row)
+    while width and _is_empty(row[width - 1]):
+        width -= 1
+    return width
+
+
+def _header_names(header_row, width=0):
+    """Turn a raw header row into column names the way pd.read_excel does.
+
+    Trailing empty cells are dropped before the header is padded to `width`
+    (the widest row with data), empty cells become "Unnamed: i", and duplicate
+    names are renamed "A", "A.1", "A.2", ... skipping names already used
+    elsewhere in the header.
+    """
+    names = list(header_row)[:_row_width(header_row)]
+    names += [None] * (width - len(names))
+    unnamed = [i for i, name in enumerate(names) if _is_empty(name)]
+    for i in unnamed:
+        names[i] = f"Unnamed: {i}"
+
+    # Named columns keep their names before unnamed ones are renamed
+    counts = {}
+    for i in [i for i in range(len(names)) if i not in unnamed] + unnamed:
+        name = original = names[i]
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[original] = count + 1
+            name = f"{original}.{count}"
+            count = count + 1 if name in names else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+
+def read_excel_header(file, sheet_name=0):
+    """Read the header row of a sheet without loading any data rows.
+
+    Data rows are streamed once only to measure their width, so columns with
+    data under an empty header cell are still listed as "Unnamed: i".
+    """
+    workbook, sheet = _open_sheet(file, sheet_name)
+    try:
+        rows = sheet.iter_rows(values_only=True)
+        header_row = next(rows, ())
+        width = max((_row_width(row) for row in rows), default=0)
+        return _header_names(header_row, width)
+    finally:
+        workbook.close()
+
+
+def read_excel_columns(file, columns, sheet_name=0, chunk_size=CHUNK_SIZE):
+    """Stream only the selected columns of a sheet into a DataFrame.
+
+    Rows are read in read-only mode and buffered `chunk_size` at a time; each
+    buffer is converted to a typed Series before the next one is read, so
+    memory grows with the selected columns instead of the whole workbook.
+    """
+    workbook, sheet = _open_sheet(file, sheet_name)
+    try:
+        # Cells rather than bare values, so error cells (#DIV/0!, #REF!, ...) can be recognised
+        rows = sheet.iter_rows()
+        # Columns past the last header cell are only known by their "Unnamed: i" position
+        width = max(
+            (int(column[len("Unnamed: "):]) + 1 for column in columns
+             if isinstance(column, str) and re.fullmatch(r"Unnamed: \d+", column)),
+            default=0,
+        )
+        header = _header_names([cell.value for cell in next(rows, ())], width)
+
+        missing = [column for column in columns if column not in header]
+        if missing:
+            raise KeyError(f"Columns not found in sheet: {', '.join(missing)}")
+
+        positions = {column: header.index(column) for column in columns}
+        buffers = {column: [] for column in columns}
+        chunks = {column: [] for column in columns}
+
+        def flush():
+            for column in columns:
+                if buffers[column]:
+                    chunks[column].append(pd.Series(buffers[column]))
+                    buffers[column] = []
+
+        buffered = 0
+        blank_rows = 0
+        for row in rows:
+            # Blank rows are kept as missing values unless they trail the data, as pd.read_excel does
+            if all(_is_empty(cell.value) for cell in row):
+                blank_rows += 1
+                continue
+            for _ in range(blank_rows):
+                for column in columns:
+                    buffers[column].append(np.nan)
+            buffered += blank_rows
+            blank_rows = 0
+            for column, position in positions.items():
+                buffers[column].append(_cell_value(row[position]) if position < len(row) else np.nan)
+            buffered += 1
+            if buffered >= chunk_size:
+                flush()
+                buffered = 0
+        flush()
+    finally:
+        workbook.close()
+
+    # Chunks are typed independently (an all-empty chunk is object dtype), so
+    # settle each column's dtype once over the whole column
+    data = {
+        column: pd.concat(chunks[column], ignore_index=True).infer_objects() if chunks[column] else pd.Series(dtype=object)
+        for column in columns
+    }
+    return pd.DataFrame(data, columns=list(columns))
@@ -1,6 +1,52 @@
 import streamlit as st
 import pandas as pd
 import os
+from excel_loader import read_excel_header, read_excel_columns
+
+
+def ranking_editor(table_key, base_table, max_rank):
+    """Edit ranks for every item in one table and return (ranked rows, duplicate rows).
+
+    The edited table is kept in session state so rankings survive reruns and page switches.
+    """
+    label_columns = list(base_table.columns)
+    base_table = base_table.reset_index(drop=True)
+    editor_key = f"{table_key}_editor"
+    snapshot_key = f"{table_key}_snapshot"
+
+    saved = st.session_state.get(table_key)
+    if saved is None:
+        saved = base_table.assign(Rank=0)
+    elif saved[label_columns].fillna('').values.tolist() != base_table.fillna('').values.tolist():
+        # The items changed (e.g. a different master sheet): rebuild, carrying existing ranks over
+        saved = base_table.merge(saved, on=label_columns, how='left')
+        saved['Rank'] = saved['Rank'].fillna(0).astype(int)
+        st.session_state.pop(editor_key, None)
+        st.session_state.pop(snapshot_key, None)
+    st.session_state[table_key] = saved
+
+    # Older Streamlit versions key the editor on its input data, so the input must stay
+    # unchanged while the editor is mounted; refresh it only when the editor is not
+    if editor_key not in st.session_state or snapshot_key not in st.session_state:
+        st.session_state[snapshot_key] = saved
+    edited = st.data_editor(
+        st.session_state[snapshot_key],
+        column_config={
+            **{col: st.column_config.TextColumn(col, disabled=True) for col in label_columns},
+            'Rank': st.column_config.NumberColumn('Rank', min_value=0, max_value=max_rank, step=1),
+        },
+        hide_index=True,
+        use_container_width=True,
+        key=editor_key,
+    )
+    edited['Rank'] = edited['Rank'].fillna(0).astype(int)
+    st.session_state[table_key] = edited
+
+    # Validate rank uniqueness across all assigned items in one pass
+    ranked = edited[edited['Rank'] > 0]
+    duplicates = ranked[ranked['Rank'].duplicated(keep=False)].sort_values('Rank')
+    return ranked, duplicates
+
 
 st.title("ETERNALS")
 # Constants
@@ -10,7 +56,21 @@ MASTER_FILE = "MASTER EXCEL.xlsx"
 if not os.path.exists(MASTER_FILE):
     st.error(f"Master file '{MASTER_FILE}' is missing in the project folder!")
 else:
-    master_sheet = pd.read_excel(MASTER_FILE, sheet_name='Sheet1')
+    # Large workbook mode: scan the header first, then stream only the chosen columns
+    stream_columns = st.sidebar.checkbox("Large workbook mode (load selected columns only)")
+    if stream_columns:
+        header_columns = read_excel_header(MASTER_FILE, sheet_name='Sheet1')
+        # Columns the pages rely on are always loaded; the user picks any extras
+        required_columns = ['State', 'Program', 'TYPE', 'College Name', 'MCC College Code', 'COURSE CODE']
+        extra_columns = st.sidebar.multiselect(
+            "Additional columns to load:",
+            [col for col in header_columns if col not in required_columns],
+            default=[col for col in ['Fees'] if col in header_columns]
+        )
+        columns_to_load = [col for col in header_columns if col in required_columns or col in extra_columns]
+        master_sheet = read_excel_columns(MASTER_FILE, columns_to_load, sheet_name='Sheet1')
+    else:
+        master_sheet = pd.read_excel(MASTER_FILE, sheet_name='Sheet1')
 
     # Normalize `State`, `Program`, and `TYPE` columns
     master_sheet['State'] = master_sheet['State'].str.strip().str.upper()
@@ -46,25 +106,21 @@ else:
                 rank_tab1, rank_tab2 = st.tabs(["Assign Rankings", "View Entered Rankings"])
 
                 with rank_tab1:
-                    state_ranking = {}
-                    ranked_data = []
-
-                    for state in unique_states:
-                        col1, col2 = st.columns([4, 1])  # Adjusted column widths for better layout
-                        with col1:
-                            rank = st.selectbox(
-                                state,  # Directly display the state name
-                                options=[0] + [i for i in range(1, len(unique_states) + 1) if i not in state_ranking.values()],
-                                key=f"state_{state}",
-                            )
-                        if rank > 0:
-                            state_ranking[state] = rank
-                            ranked_data.append({"State": state, "Rank": rank})
+                    st.write("Enter a rank for each state (0 = not ranked).")
+                    ranked_states, duplicate_states = ranking_editor(
+                        'state_rank_table',
+                        pd.DataFrame({'State': unique_states}),
+                        len(unique_states),
+                    )
+                    if not duplicate_states.empty:
+                        st.error("Each rank can only be used once. Duplicate state ranks:")
+                        st.dataframe(duplicate_states, hide_index=True)
+                    state_ranking = dict(zip(ranked_states['State'], ranked_states['Rank']))
 
                 with rank_tab2:
-                    if ranked_data:
-                        # Convert to DataFrame and reset the index to start from 1
-                        state_df = pd.DataFrame(ranked_data).sort_values("Rank")
+                    if not ranked_states.empty:
+                        # Sort by rank and reset the index to start from 1
+                        state_df = ranked_states.sort_values("Rank")
                         state_df.index = range(1, len(state_df) + 1)  # Reset index to start from 1
                         st.write("### Entered State Rankings")
                         st.dataframe(state_df)
@@ -77,28 +133,22 @@ else:
                 rank_tab1, rank_tab2 = st.tabs(["Assign Rankings", "View Entered Rankings"])
 
                 with rank_tab1:
-                    all_programs = master_sheet[['TYPE', 'Program']].drop_duplicates()
-                    program_ranking = {}
-                    ranked_data = []
-
-                    for _, row in all_programs.iterrows():
-                        program = row['Program']
-                        program_type = row['TYPE']
-                        col1, col2 = st.columns([4, 1])  # Adjusted column widths for better layout
-                        with col1:
-                            rank = st.selectbox(
-                                f"{program} ({program_type})",  # Concise label with program and type
-                                options=[0] + [i for i in range(1, len(all_programs) + 1) if i not in program_ranking.values()],
-                                key=f"program_{program}_{program_type}",
-                            )
-                        if rank > 0:
-                            program_ranking[(program, program_type)] = rank
-                            ranked_data.append({"Program": program, "TYPE": program_type, "Rank": rank})
+                    all_programs = master_sheet[['Program', 'TYPE']].drop_duplicates().reset_index(drop=True)
+                    st.write("Enter a rank for each program and type (0 = not ranked).")
+                    ranked_programs, duplicate_programs = ranking_editor(
+                        'program_rank_table',
+                        all_programs,
+                        len(all_programs),
+                    )
+                    if not duplicate_programs.empty:
+                        st.error("Each rank can only be used once. Duplicate program ranks:")
+                        st.dataframe(duplicate_programs, hide_index=True)
+                    program_ranking = dict(zip(zip(ranked_programs['Program'], ranked_programs['TYPE']), ranked_programs['Rank']))
 
                 with rank_tab2:
-                    if ranked_data:
-                        # Convert to DataFrame and reset the index to start from 1
-                        program_df = pd.DataFrame(ranked_data).sort_values("Rank")
+                    if not ranked_programs.empty:
+                        # Sort by rank and reset the index to start from 1
+                        program_df = ranked_programs.sort_values("Rank")
                         program_df.index = range(1, len(program_df) + 1)  # Reset index to start from 1
                         st.write("### Entered Program Rankings")
                         st.dataframe(program_df)
@@ -121,11 +171,16 @@ else:
 
                 # Generate Order Table button
                 if st.button("Generate Order Table"):
+                    if not duplicate_states.empty or not duplicate_programs.empty:
+                        st.error("Resolve duplicate ranks before generating the order table.")
+                        st.stop()
+
                     # Apply rankings to the master sheet
                     master_sheet['State Rank'] = master_sheet['State'].map(state_ranking).fillna(0)
-                    master_sheet['Program Rank'] = master_sheet.apply(
-                        lambda x: program_ranking.get((x['Program'], x['TYPE']), 0), axis=1
-                    )
+                    program_keys = pd.MultiIndex.from_frame(master_sheet[['Program', 'TYPE']])
+                    master_sheet['Program Rank'] = pd.Series(
+                        program_keys.map(program_ranking), index=master_sheet.index
+                    ).fillna(0).astype(int)
 
                     # Filter and sort data
                     ordered_data = master_sheet.query("`State Rank` > 0 and `Program Rank` > 0").sort_values(
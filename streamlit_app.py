@@ -6,6 +6,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from io import BytesIO
 from docx import Document
+from excel_loader import read_excel_header, read_excel_columns
 
 
 # Function to create a Word document
@@ -58,7 +59,17 @@ st.title("Streamlit Data Analysis App")
 uploaded_file = st.file_uploader("Upload your Excel file", type=["xlsx"])
 
 if uploaded_file:
-    df = pd.read_excel(uploaded_file)
+    # Large workbook mode: scan the header first, then stream only the chosen columns
+    stream_columns = st.checkbox("Large workbook mode (load selected columns only)")
+    if stream_columns:
+        header_columns = read_excel_header(uploaded_file)
+        columns_to_load = st.multiselect("Select Columns to Load", header_columns)
+        if not columns_to_load:
+            st.info("Select at least one column to load the data.")
+            st.stop()
+        df = read_excel_columns(uploaded_file, columns_to_load)
+    else:
+        df = pd.read_excel(uploaded_file)
     export_content = []
 
     # Tab structure